@@ -5,10 +5,83 @@ Extracted from the bloated multi-arms standalone file for simplicity.
 """
 
 import logging
-from typing import Dict, List, Any
+import os
+import platform
+import struct
+from typing import Any, Callable, Dict, List, Tuple
 
 logger = logging.getLogger(__name__)
 
+try:
+    import scservo_sdk as _scs  # type: ignore
+except ImportError:
+    _scs = None
+
+# Host OS, resolved once at import
+_SYSTEM = platform.system()
+
+# macOS ioctl from IOKit/serial/ioss.h: _IOW('T', 0, unsigned long), receive latency in microseconds
+IOSSDATALAT = 0x80085400
+
+
+def enable_low_latency(ser: Any) -> bool:
+    """Put a USB-serial adapter into low-latency mode.
+    
+    USB-serial bridges buffer input for up to 16 ms before handing it to the host,
+    which dominates every request/response round-trip to the servos. Returns True
+    if low-latency mode was enabled.
+    """
+    if _SYSTEM == "Darwin":
+        try:
+            import fcntl
+            fcntl.ioctl(ser.fileno(), IOSSDATALAT, struct.pack("L", 1))
+            return True
+        except (ImportError, OSError, ValueError) as e:
+            logger.debug(f"IOSSDATALAT failed on {ser.port}: {e}")
+            return False
+            
+    if _SYSTEM != "Linux":
+        return False
+        
+    try:
+        # pyserial issues the TIOCSSERIAL ioctl with ASYNC_LOW_LATENCY
+        ser.set_low_latency_mode(True)
+        return True
+    except (AttributeError, OSError, ValueError) as e:
+        logger.debug(f"set_low_latency_mode failed on {ser.port}: {e}")
+        
+    # FTDI adapters expose their latency timer through sysfs
+    latency_timer = f"/sys/bus/usb-serial/devices/{os.path.basename(os.path.realpath(ser.port))}/latency_timer"
+    try:
+        with open(latency_timer, 'w') as f:
+            f.write("1")
+        return True
+    except OSError as e:
+        logger.debug(f"Could not write {latency_timer}: {e}")
+        
+    return False
+
+
+def broadcast_ping(packet_handler: Any, port_handler: Any, scs: Any) -> Dict[int, Any]:
+    """Ping every motor on the bus with one broadcast packet.
+    
+    Returns a dict keyed by responding motor ID, or an empty dict if the SDK
+    does not support broadcast ping for this protocol or the ping fails.
+    """
+    ping = getattr(packet_handler, "broadcastPing", None)
+    if ping is None:
+        return {}
+        
+    try:
+        detected, result = ping(port_handler)
+    except Exception as e:
+        logger.debug(f"Broadcast ping failed: {e}")
+        return {}
+        
+    if result != scs.COMM_SUCCESS or not isinstance(detected, dict):
+        return {}
+    return detected
+
 
 class SO101Controller:
     """Controller for SO101 robot with Feetech STS3215 motors."""
@@ -28,14 +101,13 @@ class SO101Controller:
         self.connected = False
         self.resolution = 4096  # STS3215 has 4096 resolution (0-4095)
         
-        try:
-            import scservo_sdk as scs  # type: ignore
-            self.scs = scs
-        except ImportError:
+        if _scs is None:
             raise RuntimeError("scservo_sdk not installed. Please install from Feetech SDK")
+        self.scs = _scs
             
         self.port_handler: Any = None
         self.packet_handler: Any = None
+        self._position_reader: Any = None
         
     def connect(self) -> None:
         """Connect to the robot."""
@@ -48,55 +120,89 @@ class SO101Controller:
         if not self.port_handler.setBaudRate(self.baudrate):
             raise RuntimeError(f"Failed to set baudrate to {self.baudrate}")
             
-        # Test connection by pinging motors
+        # setBaudRate reopens the serial port, so this must come after it
+        if not enable_low_latency(self.port_handler.ser):
+            logger.debug(f"Low-latency mode not available on {self.port}")
+            
+        # Size the Windows driver buffers so sync-read replies are not split across reads
+        if _SYSTEM == "Windows":
+            try:
+                self.port_handler.ser.set_buffer_size(rx_size=65536, tx_size=65536)
+            except Exception as e:
+                logger.debug(f"Could not resize serial buffers on {self.port}: {e}")
+                
+        # Discover all motors with one broadcast ping, then ping only the ones it missed
+        detected = broadcast_ping(self.packet_handler, self.port_handler, self.scs)
+        ping, port_handler = self.packet_handler.ping, self.port_handler
+        unpack = None
         for motor_id in self.motor_ids:
+            if motor_id in detected:
+                continue
             try:
-                ping_result = self.packet_handler.ping(self.port_handler, motor_id)
-                # Handle different return formats from Feetech SDK
-                if isinstance(ping_result, tuple) and len(ping_result) >= 2:
-                    if len(ping_result) >= 3:
-                        model_number, result, error = ping_result[:3]
-                    else:
-                        model_number, result = ping_result[:2]
-                    
-                    if result != self.scs.COMM_SUCCESS:
-                        raise RuntimeError(f"Failed to ping motor {motor_id}: {self.packet_handler.getTxRxResult(result)}")
-                else:
-                    raise RuntimeError(f"Unexpected ping result: {ping_result}")
+                ping_result = ping(port_handler, motor_id)
+                if unpack is None:
+                    unpack = self._result_unpacker(ping_result)
+                model_number, result, error = unpack(ping_result)
+                
+                if result != self.scs.COMM_SUCCESS:
+                    raise RuntimeError(f"Failed to ping motor {motor_id}: {self.packet_handler.getTxRxResult(result)}")
             except Exception as e:
                 raise RuntimeError(f"Failed to ping motor {motor_id}: {str(e)}")
                 
+        # Build the position sync-read group once and reuse it for every read
+        self._position_reader = self.scs.GroupSyncRead(
+            port_handler, self.packet_handler, self.PRESENT_POSITION, 2)
+        add_param = self._position_reader.addParam
+        for motor_id in self.motor_ids:
+            add_param(motor_id)
+            
         self.connected = True
         logger.info(f"Connected to {self.robot_id} at {self.port}")
         
+    @staticmethod
+    def _result_unpacker(sample: Any) -> Callable[[tuple], Tuple[Any, int, int]]:
+        """Pick a (value, result, error) unpacker for this SDK's return format.
+        
+        Older Feetech SDKs return (value, result), newer ones (value, result, error);
+        the format is checked once against a sample instead of on every packet.
+        """
+        if not isinstance(sample, tuple) or len(sample) < 2:
+            raise RuntimeError(f"Unexpected SDK result format: {sample}")
+        if len(sample) >= 3:
+            return lambda r: (r[0], r[1], r[2])
+        return lambda r: (r[0], r[1], 0)
+        
     def disconnect(self) -> None:
         """Disconnect from the robot."""
         if self.port_handler:
             self.port_handler.closePort()
+        self._position_reader = None
         self.connected = False
         
     def read_positions(self) -> Dict[int, int]:
-        """Read current positions from all motors."""
-        positions = {}
-        for motor_id in self.motor_ids:
-            try:
-                read_result = self.packet_handler.read2ByteTxRx(
-                    self.port_handler, motor_id, self.PRESENT_POSITION)
+        """Read current positions from all motors with a single sync-read packet.
+        
+        A dropped reply is retried once; if any motor is still unread a RuntimeError
+        is raised rather than returning a partial result.
+        """
+        if not self.connected:
+            raise RuntimeError(f"{self.robot_id} is not connected; call connect() first")
+            
+        # Bind per-motor lookups to locals for the loops below
+        group_reader = self._position_reader
+        is_available, get_data = group_reader.isAvailable, group_reader.getData
+        motor_ids, address = self.motor_ids, self.PRESENT_POSITION
+        
+        for _ in range(2):
+            result = group_reader.txRxPacket()
+            if result != self.scs.COMM_SUCCESS:
+                logger.warning(f"Sync read failed on {self.robot_id}: {self.packet_handler.getTxRxResult(result)}")
                 
-                # Handle different return formats
-                if len(read_result) >= 3:
-                    position, result, error = read_result
-                elif len(read_result) == 2:
-                    position, result = read_result
-                    error = 0
-                else:
-                    logger.warning(f"Unexpected read result format from motor {motor_id} on {self.robot_id}: {read_result}")
-                    continue
-                    
-                if result == self.scs.COMM_SUCCESS:
-                    positions[motor_id] = position
-                else:
-                    logger.warning(f"Failed to read position from motor {motor_id} on {self.robot_id}")
-            except Exception as e:
-                logger.warning(f"Exception reading position from motor {motor_id} on {self.robot_id}: {e}")
-        return positions
\ No newline at end of file
+            missing = [motor_id for motor_id in motor_ids if not is_available(motor_id, address, 2)]
+            if not missing:
+                break
+                
+        if missing:
+            raise RuntimeError(f"Failed to read positions from motors {missing} on {self.robot_id}")
+            
+        return {motor_id: get_data(motor_id, address, 2) for motor_id in motor_ids}
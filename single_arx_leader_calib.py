@@ -19,30 +19,84 @@ Usage:
 import argparse
 import json
 import logging
+import math
 import os
 import platform
 import sys
+import tempfile
 import time
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+# Single-keypress input: msvcrt on Windows, select + termios everywhere else
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
+    import select
+    import termios
+    import tty
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-try:
-    from colorama import init, Fore, Style
-    init()
-except ImportError:
-    # Fallback if colorama not installed
-    class Fore:
-        RED = GREEN = YELLOW = CYAN = MAGENTA = BLUE = ""
-    class Style:
-        RESET_ALL = BRIGHT = ""
+# Plain-text fallbacks, replaced by colorama in _init_color()
+class Fore:
+    RED = GREEN = YELLOW = CYAN = MAGENTA = BLUE = ""
+class Style:
+    RESET_ALL = BRIGHT = ""
+
+
+def _init_color():
+    """Load colorama for colored output, if installed."""
+    global Fore, Style
+    try:
+        from colorama import init, Fore, Style
+        init()
+    except ImportError:
+        pass
+
+
+@lru_cache(maxsize=None)
+def _calibration_decoder():
+    """Typed msgspec decoder for the calibration file (requires msgspec)."""
+    import msgspec
+    
+    class CalibrationFile(msgspec.Struct):
+        timestamp: float
+        motor_ids: List[int]
+        home_positions: Dict[int, int]
+        servo_resolution: int
+        voltage: float
+        is_leader: bool
+        timestamp_str: str = "Unknown"
+        port: str = ""
+        notes: str = ""
+        
+    return msgspec.json.Decoder(CalibrationFile)
+
+
+# Keys the calibration file must have (the required fields of CalibrationFile above)
+# and defaults for the optional ones, for loading without msgspec
+_REQUIRED_CALIBRATION_KEYS = ("timestamp", "motor_ids", "home_positions", "servo_resolution", "voltage", "is_leader")
+_CALIBRATION_DEFAULTS = {"timestamp_str": "Unknown", "port": "", "notes": ""}
+
 
 # Default calibration file path
 CALIBRATION_FILE = "arx_leader_calibration.json"
 
+# Servo tics to radians, the same scale the follower uses for teleoperation
+TICS_TO_RADIANS = 2 * math.pi / 4095.0
+
+# Position change (tics) below which the displayed table is reused as-is
+DISPLAY_DEADBAND_TICS = 2
+
+# Live position table refresh rate during guided calibration
+LIVE_REFRESH_HZ = 30
+
 
 # HARDCODED PORT - Change this to match your setup
 LEADER_PORT = "/dev/tty.usbmodem5A680135841"
@@ -51,9 +105,13 @@ LEADER_PORT = "/dev/tty.usbmodem5A680135841"
 class LeaderArmCalibrator:
     """Calibrates leader servo arm positions for ARX teleoperation."""
     
+    # Position table row templates, parsed once instead of per f-string
+    _ROW_FMT = "{:<10} | {:>10} | {:>9.1f}° | {:>7.1f}%\n".format
+    _ERROR_ROW_FMT = "{:<10} | {:>10} | {:>10} | {:>8}\n".format
+    
     def __init__(self, port: str, motor_ids: List[int], baudrate: int = 1000000):
         self.port = port
-        self.motor_ids = motor_ids
+        self.motor_ids = sorted(motor_ids)  # Sorted once; display order everywhere
         self.baudrate = baudrate
         self.connected = False
         self.servo_controller = None
@@ -66,19 +124,28 @@ class LeaderArmCalibrator:
         self._init_servo_controller()
         
     def _init_servo_controller(self):
-        """Initialize the servo controller."""
-        try:
-            import scservo_sdk as scs
-            self.scs = scs
-        except ImportError:
-            raise RuntimeError("scservo_sdk not installed. Please install from Feetech SDK")
-            
+        """Initialize the servo controller state (the SDK is imported on connect)."""
+        self.scs = None
         self.port_handler = None
         self.packet_handler = None
+        self.group_reader = None
+        self._last_voltage: Optional[float] = None
+        self.is_leader = False
+        
+        # Last rendered position table, reused while the arm is stationary
+        self._last_positions: Dict[int, int] = {}
+        self._last_lines: List[str] = []
         
     def connect(self) -> bool:
         """Connect to the servo controller."""
         try:
+            try:
+                import scservo_sdk as scs
+                self.scs = scs
+            except ImportError:
+                raise RuntimeError("scservo_sdk not installed. Please install from Feetech SDK")
+            from servo_controller import broadcast_ping, enable_low_latency
+            
             self.port_handler = self.scs.PortHandler(self.port)
             self.packet_handler = self.scs.PacketHandler(0)  # Protocol 0
             
@@ -88,9 +155,18 @@ class LeaderArmCalibrator:
             if not self.port_handler.setBaudRate(self.baudrate):
                 raise RuntimeError(f"Failed to set baudrate to {self.baudrate}")
                 
-            # Test connection by pinging motors
+            # setBaudRate reopens the serial port, so this must come after it
+            if not enable_low_latency(self.port_handler.ser):
+                logger.debug(f"Low-latency mode not available on {self.port}")
+                
+            # Test connection: one broadcast ping, then individual pings for any stragglers
             logger.info("Testing connection to servos...")
+            detected = broadcast_ping(self.packet_handler, self.port_handler, self.scs)
             for motor_id in self.motor_ids:
+                if motor_id in detected:
+                    logger.info(f"✓ Motor {motor_id} connected")
+                    continue
+                    
                 ping_result = self.packet_handler.ping(self.port_handler, motor_id)
                 if isinstance(ping_result, tuple) and len(ping_result) >= 2:
                     if len(ping_result) >= 3:
@@ -103,7 +179,18 @@ class LeaderArmCalibrator:
                         
                 logger.info(f"✓ Motor {motor_id} connected")
                 
+            # Sync-read group spanning PRESENT_POSITION (56) through PRESENT_VOLTAGE (62),
+            # reused on every refresh so position and voltage come back in one transaction
+            self.group_reader = self.scs.GroupSyncRead(self.port_handler, self.packet_handler, 56, 7)
+            for motor_id in self.motor_ids:
+                self.group_reader.addParam(motor_id)
+                
             self.connected = True
+            
+            # Classify the arm once from its supply voltage (leader arms run at ~5V)
+            self._last_voltage = self.read_servo_voltage()
+            self.is_leader = 4.5 <= self._last_voltage <= 5.5
+            
             logger.info(f"{Fore.GREEN}✓ Connected to leader arm on {self.port}{Style.RESET_ALL}")
             return True
             
@@ -118,11 +205,38 @@ class LeaderArmCalibrator:
         self.connected = False
         logger.info("Disconnected from leader arm")
         
-    def read_servo_positions(self) -> Dict[int, int]:
-        """Read current positions from all servos."""
+    def read_servo_positions(self, quiet: bool = False) -> Dict[int, int]:
+        """Read current positions from all servos with a single sync-read.
+        
+        The voltage of the first servo arrives in the same packet and is cached
+        for display_current_positions and save_calibration. With quiet=True read
+        failures are logged at debug level only; the live display shows missing
+        motors as ERROR rows instead.
+        """
         if not self.connected:
             raise RuntimeError("Not connected to servos")
             
+        warn = logger.debug if quiet else logger.warning
+        result = self.group_reader.txRxPacket()
+        if result != self.scs.COMM_SUCCESS:
+            warn("Sync read failed, falling back to per-motor reads")
+            return self._read_servo_positions_individually(quiet)
+            
+        positions = {}
+        for motor_id in self.motor_ids:
+            if self.group_reader.isAvailable(motor_id, 56, 2):
+                positions[motor_id] = self.group_reader.getData(motor_id, 56, 2)
+            else:
+                warn(f"Failed to read position from motor {motor_id}")
+                
+        if self.group_reader.isAvailable(self.motor_ids[0], 62, 1):
+            self._last_voltage = self.group_reader.getData(self.motor_ids[0], 62, 1) / 10.0
+            
+        return positions
+        
+    def _read_servo_positions_individually(self, quiet: bool = False) -> Dict[int, int]:
+        """Read current positions one servo at a time."""
+        warn = logger.debug if quiet else logger.warning
         positions = {}
         for motor_id in self.motor_ids:
             try:
@@ -138,12 +252,12 @@ class LeaderArmCalibrator:
                     if result == self.scs.COMM_SUCCESS:
                         positions[motor_id] = position
                     else:
-                        logger.warning(f"Failed to read position from motor {motor_id}")
+                        warn(f"Failed to read position from motor {motor_id}")
                 else:
-                    logger.warning(f"Unexpected read result from motor {motor_id}: {read_result}")
+                    warn(f"Unexpected read result from motor {motor_id}: {read_result}")
                     
             except Exception as e:
-                logger.warning(f"Exception reading motor {motor_id}: {e}")
+                warn(f"Exception reading motor {motor_id}: {e}")
                 
         return positions
         
@@ -171,24 +285,53 @@ class LeaderArmCalibrator:
             
         return 0.0
         
-    def display_current_positions(self):
-        """Display current servo positions in a readable format."""
-        positions = self.read_servo_positions()
-        voltage = self.read_servo_voltage()
+    def _cached_voltage(self) -> float:
+        """Voltage from the last sync-read, falling back to a direct read."""
+        if self._last_voltage is not None:
+            return self._last_voltage
+        return self.read_servo_voltage()
+        
+    def display_current_positions(self) -> int:
+        """Display current servo positions in a readable format.
+        
+        Returns the number of lines written so the caller can redraw in place.
+        Read errors appear as ERROR rows rather than log lines, which would
+        throw off that line count.
+        """
+        positions = self.read_servo_positions(quiet=True)
+        voltage = self._cached_voltage()
         
-        print(f"\n{Fore.CYAN}Current Leader Arm Status:{Style.RESET_ALL}")
-        print(f"Voltage: {voltage:.1f}V")
-        print(f"{'Motor ID':<10} | {'Position':>10} | {'Degrees':>10} | {'Percent':>8}")
-        print("-" * 50)
+        frame = "".join([
+            f"\n{Fore.CYAN}Current Leader Arm Status:{Style.RESET_ALL}\n",
+            f"Voltage: {voltage:.1f}V\n",
+            f"{'Motor ID':<10} | {'Position':>10} | {'Degrees':>10} | {'Percent':>8}\n",
+            "-" * 50 + "\n",
+            *self._position_lines(positions),
+        ])
+        sys.stdout.write(frame)
+        sys.stdout.flush()
+        return frame.count("\n")
         
-        for motor_id in sorted(self.motor_ids):
+    def _position_lines(self, positions: Dict[int, int]) -> List[str]:
+        """Format the position table rows, reusing the last rows if nothing moved."""
+        if (self._last_lines and positions.keys() == self._last_positions.keys() and
+                max((abs(pos - self._last_positions[motor_id]) for motor_id, pos in positions.items()),
+                    default=0) < DISPLAY_DEADBAND_TICS):
+            return self._last_lines
+            
+        lines = []
+        for motor_id in self.motor_ids:
             position = positions.get(motor_id, -1)
             if position >= 0:
                 degrees = (position / self.resolution) * 360
                 percent = (position / self.max_position) * 100
-                print(f"{motor_id:<10} | {position:>10} | {degrees:>9.1f}° | {percent:>7.1f}%")
+                lines.append(self._ROW_FMT(motor_id, position, degrees, percent))
             else:
-                print(f"{motor_id:<10} | {'ERROR':>10} | {'---':>10} | {'---':>8}")
+                lines.append(self._ERROR_ROW_FMT(motor_id, 'ERROR', '---', '---'))
+                
+        self._last_positions = positions
+        self._last_lines = lines
+        return lines
                 
     def capture_home_positions(self) -> Dict[int, int]:
         """Capture current positions as home reference."""
@@ -204,8 +347,7 @@ class LeaderArmCalibrator:
                         calibration_file: str = CALIBRATION_FILE) -> bool:
         """Save calibration data to JSON file."""
         try:
-            voltage = self.read_servo_voltage()
-            is_leader = 4.5 <= voltage <= 5.5
+            voltage = self._cached_voltage()
             
             calibration_data = {
                 "timestamp": time.time(),
@@ -215,12 +357,31 @@ class LeaderArmCalibrator:
                 "servo_resolution": self.resolution,
                 "port": self.port,
                 "voltage": voltage,
-                "is_leader": is_leader,
+                "is_leader": self.is_leader,
                 "notes": "Leader arm home positions corresponding to ARX R5 home pose"
             }
             
-            with open(calibration_file, 'w') as f:
-                json.dump(calibration_data, f, indent=2)
+            try:
+                import orjson
+                payload = orjson.dumps(calibration_data,
+                                       option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            except ImportError:
+                payload = json.dumps(calibration_data, indent=2).encode()
+                
+            # Write to a temp file in the same directory and swap it in, so an
+            # interrupted save never leaves a truncated calibration behind
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(calibration_file)),
+                                            suffix=".tmp")
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(payload)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.chmod(tmp_path, 0o644)  # mkstemp creates files readable only by the owner
+                os.replace(tmp_path, calibration_file)
+            except Exception:
+                os.unlink(tmp_path)
+                raise
                 
             logger.info(f"{Fore.GREEN}✓ Calibration saved to {calibration_file}{Style.RESET_ALL}")
             return True
@@ -236,8 +397,29 @@ class LeaderArmCalibrator:
                 logger.warning(f"Calibration file not found: {calibration_file}")
                 return None
                 
-            with open(calibration_file, 'r') as f:
-                calibration_data = json.load(f)
+            try:
+                import msgspec
+            except ImportError:
+                msgspec = None
+                
+            if msgspec is not None:
+                # Validates the file shape and decodes home_positions with int keys
+                calibration = _calibration_decoder().decode(Path(calibration_file).read_bytes())
+                calibration_data = msgspec.structs.asdict(calibration)
+            else:
+                with open(calibration_file, 'r') as f:
+                    calibration_data = json.load(f)
+                    
+                # Reject the same files the msgspec schema would
+                missing = [key for key in _REQUIRED_CALIBRATION_KEYS if key not in calibration_data]
+                if missing:
+                    raise ValueError(f"Calibration file is missing required keys: {', '.join(missing)}")
+                calibration_data = {**_CALIBRATION_DEFAULTS, **calibration_data}
+                    
+                # JSON object keys are always strings; convert back to motor IDs once here
+                calibration_data["home_positions"] = {
+                    int(motor_id): pos for motor_id, pos in calibration_data["home_positions"].items()
+                }
                 
             logger.info(f"✓ Loaded calibration from {calibration_file}")
             logger.info(f"  Created: {calibration_data.get('timestamp_str', 'Unknown')}")
@@ -256,26 +438,69 @@ class LeaderArmCalibrator:
             logger.error("No calibration data available for testing")
             return
             
+        import numpy as np
+            
         home_positions = calibration_data["home_positions"]
         current_positions = self.read_servo_positions()
         
-        print(f"\n{Fore.YELLOW}Calibration Test - Position Differences:{Style.RESET_ALL}")
-        print(f"{'Motor':<8} | {'Home':>8} | {'Current':>8} | {'Diff':>8} | {'Radians':>10}")
-        print("-" * 55)
+        motor_ids = self.motor_ids
+        home = np.fromiter((home_positions.get(motor_id, 0) for motor_id in motor_ids),
+                           dtype=np.int32, count=len(motor_ids))
+        current = np.fromiter((current_positions.get(motor_id, 0) for motor_id in motor_ids),
+                              dtype=np.int32, count=len(motor_ids))
+        diff_tics = current - home
+        diff_radians = diff_tics * TICS_TO_RADIANS
         
-        for motor_id in sorted(self.motor_ids):
-            home_pos = home_positions.get(str(motor_id), 0)  # JSON keys are strings
-            current_pos = current_positions.get(motor_id, 0)
-            diff_tics = current_pos - home_pos
-            
-            # Convert to radians (same formula as teleoperation)
-            diff_radians = diff_tics * (2 * 3.14159) / 4095.0
-            
-            print(f"{motor_id:<8} | {home_pos:>8} | {current_pos:>8} | {diff_tics:>8} | {diff_radians:>9.3f}")
+        sys.stdout.write("".join([
+            f"\n{Fore.YELLOW}Calibration Test - Position Differences:{Style.RESET_ALL}\n",
+            f"{'Motor':<8} | {'Home':>8} | {'Current':>8} | {'Diff':>8} | {'Radians':>10}\n",
+            "-" * 55 + "\n",
+            *(f"{motor_id:<8} | {home_pos:>8} | {current_pos:>8} | {diff:>8} | {radians:>9.3f}\n"
+              for motor_id, home_pos, current_pos, diff, radians in zip(
+                  motor_ids, home.tolist(), current.tolist(), diff_tics.tolist(), diff_radians.tolist())),
+        ]))
+        sys.stdout.flush()
+
+
+@contextmanager
+def _single_keypress_mode():
+    """Deliver keypresses immediately, without waiting for Enter or echoing them."""
+    if msvcrt is not None or not sys.stdin.isatty():
+        yield
+        return
+        
+    fd = sys.stdin.fileno()
+    old_settings = termios.tcgetattr(fd)
+    try:
+        tty.setcbreak(fd)
+        yield
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+        
+        
+def _read_key(timeout: Optional[float]) -> Optional[str]:
+    """Return one pending keypress (lowercased), waiting up to timeout seconds (None = forever)."""
+    if msvcrt is not None:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not msvcrt.kbhit():
+            if deadline is not None and time.monotonic() >= deadline:
+                return None
+            time.sleep(0.005)
+        return msvcrt.getwch().lower()
+        
+    ready, _, _ = select.select([sys.stdin], [], [], timeout)
+    if not ready:
+        return None
+    # Read the raw fd so select() and Python's stdin buffer never disagree
+    return os.read(sys.stdin.fileno(), 1).decode(errors="ignore").lower()
 
 
 def guided_calibration(calibrator: LeaderArmCalibrator, calibration_file: str = CALIBRATION_FILE):
-    """Run the guided calibration process."""
+    """Run the guided calibration process.
+    
+    The position table streams live and is redrawn in place; single keypresses
+    select menu options without pressing Enter.
+    """
     print(f"\n{Fore.BLUE}=== ARX Leader Arm Calibration Process ==={Style.RESET_ALL}")
     print()
     print("This process will calibrate your leader servo arm to work with the ARX R5 follower.")
@@ -288,63 +513,69 @@ def guided_calibration(calibrator: LeaderArmCalibrator, calibration_file: str =
     print("4. The leader arm should mimic the ARX arm's joint angles and orientation")
     print()
     
-    # Display current status
-    calibrator.display_current_positions()
-    
-    print(f"\n{Fore.CYAN}Calibration Steps:{Style.RESET_ALL}")
+    print(f"{Fore.CYAN}Calibration Steps:{Style.RESET_ALL}")
     print("1. Position the leader arm to match ARX R5 home position")
     print("2. Confirm the positions look correct")
     print("3. Capture and save the calibration")
-    print()
     
-    while True:
-        print(f"{Fore.YELLOW}Current servo positions:{Style.RESET_ALL}")
-        calibrator.display_current_positions()
-        
-        print(f"\n{Fore.GREEN}Options:{Style.RESET_ALL}")
-        print("  [r] Refresh positions")
-        print("  [c] Capture calibration (when leader matches ARX home)")
-        print("  [t] Test existing calibration")
-        print("  [q] Quit")
-        
-        choice = input("\nEnter choice: ").lower().strip()
-        
-        if choice == 'r':
-            continue  # Refresh display
+    refresh_interval = 1.0 / LIVE_REFRESH_HZ
+    
+    with _single_keypress_mode():
+        while True:
+            sys.stdout.write(
+                f"\n{Fore.GREEN}Options (press a key):{Style.RESET_ALL}\n"
+                "  [r] Restart live display\n"
+                "  [c] Capture calibration (when leader matches ARX home)\n"
+                "  [t] Test existing calibration\n"
+                "  [q] Quit\n")
             
-        elif choice == 'c':
-            print(f"\n{Fore.YELLOW}Capturing calibration...{Style.RESET_ALL}")
-            try:
-                home_positions = calibrator.capture_home_positions()
+            # Stream positions, overwriting the previous table, until a key is pressed
+            lines_drawn = 0
+            choice = None
+            while choice is None:
+                if lines_drawn:
+                    sys.stdout.write(f"\x1b[{lines_drawn}F\x1b[J")  # Cursor up, clear to end
+                lines_drawn = calibrator.display_current_positions()
+                choice = _read_key(refresh_interval)
                 
-                print(f"\n{Fore.CYAN}Captured positions:{Style.RESET_ALL}")
-                for motor_id, pos in sorted(home_positions.items()):
-                    print(f"  Motor {motor_id}: {pos}")
+            if choice == 'r':
+                continue  # Refresh display
                 
-                confirm = input(f"\n{Fore.YELLOW}Save this calibration? (y/n): {Style.RESET_ALL}").lower()
-                if confirm in ['y', 'yes']:
-                    if calibrator.save_calibration(home_positions, calibration_file):
-                        print(f"\n{Fore.GREEN}✓ Calibration completed successfully!{Style.RESET_ALL}")
-                        print(f"Calibration saved to: {calibration_file}")
-                        print("\nYou can now use this calibration in teleoperation.")
-                        break
+            elif choice == 'c':
+                print(f"\n{Fore.YELLOW}Capturing calibration...{Style.RESET_ALL}")
+                try:
+                    home_positions = calibrator.capture_home_positions()
+                    
+                    print(f"\n{Fore.CYAN}Captured positions:{Style.RESET_ALL}")
+                    for motor_id in calibrator.motor_ids:
+                        print(f"  Motor {motor_id}: {home_positions[motor_id]}")
+                    
+                    print(f"\n{Fore.YELLOW}Save this calibration? (y/n): {Style.RESET_ALL}", end="", flush=True)
+                    confirm = _read_key(None)
+                    print(confirm)
+                    if confirm == 'y':
+                        if calibrator.save_calibration(home_positions, calibration_file):
+                            print(f"\n{Fore.GREEN}✓ Calibration completed successfully!{Style.RESET_ALL}")
+                            print(f"Calibration saved to: {calibration_file}")
+                            print("\nYou can now use this calibration in teleoperation.")
+                            break
+                        else:
+                            print(f"{Fore.RED}✗ Failed to save calibration{Style.RESET_ALL}")
                     else:
-                        print(f"{Fore.RED}✗ Failed to save calibration{Style.RESET_ALL}")
-                else:
-                    print("Calibration cancelled.")
+                        print("Calibration cancelled.")
+                        
+                except Exception as e:
+                    logger.error(f"Error during calibration: {e}")
                     
-            except Exception as e:
-                logger.error(f"Error during calibration: {e}")
+            elif choice == 't':
+                calibrator.test_calibration(calibration_file)
                 
-        elif choice == 't':
-            calibrator.test_calibration(calibration_file)
-            
-        elif choice == 'q':
-            print("Calibration cancelled.")
-            break
-            
-        else:
-            print("Invalid choice. Please try again.")
+            elif choice == 'q':
+                print("Calibration cancelled.")
+                break
+                
+            else:
+                print(f"\nInvalid choice '{choice}'. Please try again.")
 
 
 def main():
@@ -361,6 +592,8 @@ def main():
     
     args = parser.parse_args()
     
+    _init_color()
+    
     # Parse motor IDs
     motor_ids = [int(id.strip()) for id in args.motor_ids.split(",")]
     logger.info(f"Using motor IDs: {motor_ids}")
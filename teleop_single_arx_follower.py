@@ -14,6 +14,7 @@ Usage:
 import os
 import logging
 import zmq 
+from zmq import Again as ZMQAgain, NOBLOCK, POLLIN
 import json
 
 # Configure logging BEFORE importing other modules
@@ -25,15 +26,18 @@ logging.getLogger('urllib3').setLevel(logging.ERROR)
 logging.getLogger('requests').setLevel(logging.ERROR)
 logging.getLogger('httpx').setLevel(logging.ERROR)
 logging.getLogger('httpcore').setLevel(logging.ERROR)
-# Disable all INFO logs from modules starting with 'http'
-for name in logging.root.manager.loggerDict:
-    if name.startswith('http'):
-        logging.getLogger(name).setLevel(logging.ERROR)
+# Drop sub-ERROR records from any 'http*' logger, including ones created after this point
+class HttpLogFilter(logging.Filter):
+    def filter(self, record: logging.LogRecord) -> bool:
+        return record.levelno >= logging.ERROR or not record.name.startswith('http')
+
+logging.getLogger().handlers[0].addFilter(HttpLogFilter())
 
 # Suppress CANopen library logs
 logging.getLogger('canopen').setLevel(logging.WARNING)
 
 import argparse
+import gc
 # import json  # Already imported above
 import platform
 import signal
@@ -41,10 +45,18 @@ import subprocess
 import sys
 import time
 import threading
-from typing import Dict, List, Optional
+from collections import deque
+from typing import Dict, List, Optional, Union
 import numpy as np
 import canopen
 
+# Faster JSON decoding for telemetry frames if orjson is installed (same wire format)
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
 try:
     from colorama import init, Fore, Style
     init()
@@ -93,6 +105,18 @@ Z_PROFILE_ACCELERATION_RPM_S = 200  # Acceleration for Z-axis
 shutdown_requested = False
 
 
+def set_realtime_priority(priority: int = 20) -> bool:
+    """Give the calling thread SCHED_FIFO priority (Linux only, needs CAP_SYS_NICE or root)."""
+    if not hasattr(os, "sched_setscheduler"):
+        return False
+    try:
+        os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(priority))  # 0 = calling thread
+        return True
+    except OSError as e:
+        logger.debug(f"Could not set realtime priority: {e}")
+        return False
+
+
 def signal_handler(signum, frame):
     """Handle SIGINT (Ctrl+C) for graceful shutdown."""
     global shutdown_requested
@@ -100,36 +124,60 @@ def signal_handler(signum, frame):
     shutdown_requested = True
 
 
+class RollingWindow:
+    """Fixed-size window of samples with an O(1) running sum, safe to share between threads."""
+    
+    def __init__(self, size: int = 100):
+        self.samples = deque(maxlen=size)
+        self.total = 0
+        self._lock = threading.Lock()
+        
+    def __len__(self) -> int:
+        return len(self.samples)
+        
+    def append(self, value):
+        """Add a sample, evicting the oldest once the window is full."""
+        with self._lock:
+            if len(self.samples) == self.samples.maxlen:
+                self.total -= self.samples[0]
+            self.samples.append(value)
+            self.total += value
+            
+    def mean(self) -> float:
+        """Average of the samples currently in the window (0 if empty)."""
+        with self._lock:
+            return self.total / len(self.samples) if self.samples else 0.0
+
+
 class ARXPositionSmoother:
     """Smooth position changes for ARX arm to prevent jerky movements."""
     
-    def __init__(self, smoothing_factor: float = 0.8):
+    def __init__(self, smoothing_factor: float = 0.8, max_change: float = 0.1):
         self.smoothing_factor = smoothing_factor
+        self._one_minus_sf = 1.0 - smoothing_factor
+        self.max_change = max_change  # Maximum change per joint per update, in radians
         self.current_positions = np.zeros(6)  # 6 arm joints for ARX R5 (gripper handled separately)
+        self._delta = np.empty(6)  # Scratch buffer reused every update
         self.initialized = False
         
     def smooth(self, target_positions: np.ndarray) -> np.ndarray:
         """Apply exponential smoothing to position changes."""
         if not self.initialized:
-            self.current_positions = target_positions.copy()
+            self.current_positions[:] = target_positions
             self.initialized = True
             return target_positions
             
-        # Apply smoothing
-        smoothed = (self.current_positions * self.smoothing_factor + 
-                   target_positions * (1 - self.smoothing_factor))
+        # Smoothed step relative to the current position:
+        # (current * sf + target * (1 - sf)) - current == (target - current) * (1 - sf)
+        delta = self._delta
+        np.subtract(target_positions, self.current_positions, out=delta)
+        np.multiply(delta, self._one_minus_sf, out=delta)
         
         # Enforce maximum change limit per joint
-        max_change = 0.1  # Maximum change per joint in radians
-        for i in range(len(smoothed)):
-            change = abs(smoothed[i] - self.current_positions[i])
-            if change > max_change:
-                # Limit the change
-                direction = 1 if smoothed[i] > self.current_positions[i] else -1
-                smoothed[i] = self.current_positions[i] + (direction * max_change)
-                
-        self.current_positions = smoothed
-        return smoothed
+        np.clip(delta, -self.max_change, self.max_change, out=delta)
+        
+        np.add(self.current_positions, delta, out=self.current_positions)
+        return self.current_positions
 
 
 class ARXArmWrapper:
@@ -161,6 +209,19 @@ class ARXArmWrapper:
         # Load calibration data or use defaults
         self.servo_centers, self.invert_motors = self._load_calibration()
         
+        # Per-joint conversion arrays for arm motors 1-6 (index = motor ID - 1);
+        # inversion is folded into the sign of the scale
+        self._joint_centers = np.array([self.servo_centers.get(motor_id, 2048) for motor_id in range(1, 7)],
+                                       dtype=np.float64)
+        self._joint_scale = np.array([-self.servo_to_radian_scale if motor_id in self.invert_motors
+                                      else self.servo_to_radian_scale for motor_id in range(1, 7)])
+        self._joint_inv_scale = 1.0 / self._joint_scale  # Radians back to tics on the read path
+        self._gripper_center = self.servo_centers.get(7, 2048)
+        
+        # Per-frame buffers, reused so the telemetry path does not allocate
+        self._tics_buf = np.empty(6)
+        self._arm_positions = np.empty(6)
+        
     def _load_calibration(self) -> tuple[Dict[int, int], List[int]]:
         """Load servo center positions and motor inversion list from calibration file."""
         default_centers = {i: 2048 for i in range(1, 8)}  # Default center for 7 joints
@@ -172,8 +233,8 @@ class ARXArmWrapper:
             return default_centers, default_invert
             
         try:
-            with open(self.calibration_file, 'r') as f:
-                calibration_data = json.load(f)
+            with open(self.calibration_file, 'rb') as f:
+                calibration_data = json_loads(f.read())
                 
             home_positions = calibration_data.get(self.arm_name, {}).get("home_positions", {})
             motor_ids = calibration_data.get(self.arm_name, {}).get("motor_ids", list(range(1, 8)))
@@ -242,23 +303,13 @@ class ARXArmWrapper:
             
         try:
             # Read arm joint positions (6 joints)
-            joint_positions = self.arm.get_joint_positions()  # Returns radians for 6 joints
-            tics = {}
+            joint_positions = np.asarray(self.arm.get_joint_positions()[:6])  # Returns radians for 6 joints
+            num_joints = len(joint_positions)
             
-            # Convert arm joints (1-6) back to tics
-            for i, pos_rad in enumerate(joint_positions[:6]):  # 6 arm joints
-                motor_id = i + 1  # Motor IDs are 1-indexed
-                servo_center = self.servo_centers.get(motor_id, 2048)
-                
-                # Check if this motor should be inverted (reverse the inversion for reading)
-                if motor_id in self.invert_motors:
-                    # Inverted: reverse the inversion when reading back
-                    tic_pos = int(servo_center - pos_rad / self.servo_to_radian_scale)
-                else:
-                    # Normal: standard conversion
-                    tic_pos = int(pos_rad / self.servo_to_radian_scale + servo_center)
-                    
-                tics[motor_id] = tic_pos
+            # Convert arm joints (1-6) back to tics; the signed scale undoes any inversion
+            tic_positions = (joint_positions * self._joint_inv_scale[:num_joints]
+                             + self._joint_centers[:num_joints]).astype(int)
+            tics = dict(zip(range(1, num_joints + 1), tic_positions.tolist()))  # Motor IDs are 1-indexed
                 
             # Note: ARX SDK doesn't provide a way to read gripper position
             # So we can't include motor 7 in the return dict for now
@@ -269,11 +320,42 @@ class ARXArmWrapper:
             logger.error(f"Error reading joint positions: {e}")
             return {}
             
-    def write_joint_tics(self, positions: Dict[int, int]):
+    def _split_tics(self, positions: Union[Dict[int, int], List[int]]) -> tuple[np.ndarray, Optional[int]]:
+        """Convert arm joint tics (motors 1-6) to radians and pick out the gripper (motor 7).
+        
+        positions is either a dict keyed by motor ID or a list indexed by motor ID - 1
+        (the telemetry wire format). Joints missing from positions stay at their
+        calibrated center (0 rad). The returned array is a reused buffer, overwritten
+        by the next call.
+        """
+        tics = self._tics_buf
+        tics[:] = self._joint_centers
+        gripper_position = None
+        
+        if isinstance(positions, dict):
+            for motor_id, tic_pos in positions.items():
+                if 1 <= motor_id <= 6:  # Arm joints
+                    tics[motor_id - 1] = tic_pos  # Convert to 0-indexed
+                elif motor_id == 7:  # Gripper
+                    gripper_position = tic_pos
+        else:
+            num_joints = min(len(positions), 6)
+            tics[:num_joints] = positions[:num_joints]
+            if len(positions) > 6:
+                gripper_position = positions[6]
+                
+        # (tic - center) * scale for every joint at once; inverted joints have a negative scale
+        arm_positions = self._arm_positions
+        np.subtract(tics, self._joint_centers, out=arm_positions)
+        np.multiply(arm_positions, self._joint_scale, out=arm_positions)
+        return arm_positions, gripper_position
+        
+    def write_joint_tics(self, positions: Union[Dict[int, int], List[int]]):
         """Write joint positions from tic values (SO101-style interface).
         
         Args:
-            positions: Dict mapping motor ID to position in tics
+            positions: Dict mapping motor ID to position in tics, or a list of
+                      tics indexed by motor ID - 1
                       Motors 1-6: Arm joints (sent to set_joint_positions)
                       Motor 7: Gripper (sent to set_catch_pos)
         """
@@ -281,72 +363,30 @@ class ARXArmWrapper:
             return
             
         try:
-            # Separate arm joints (1-6) from gripper (7)
-            arm_positions = np.zeros(6)  # 6 joints for ARX R5 arm
-            gripper_position = None
+            arm_positions, gripper_position = self._split_tics(positions)
             
-            for motor_id, tic_pos in positions.items():
-                if 1 <= motor_id <= 6:  # Arm joints
-                    # Get calibrated center for this motor
-                    servo_center = self.servo_centers.get(motor_id, 2048)
-                    
-                    # Check if this motor should be inverted
-                    if motor_id in self.invert_motors:
-                        # Inverted: flip motion around center point
-                        rad_pos = (servo_center - tic_pos) * self.servo_to_radian_scale
-                        logger.debug(f"Motor {motor_id} inverted: {tic_pos} -> {rad_pos:.3f}")
-                    else:
-                        # Normal: standard conversion
-                        rad_pos = (tic_pos - servo_center) * self.servo_to_radian_scale
-                        
-                    arm_positions[motor_id - 1] = rad_pos  # Convert to 0-indexed
-                    
-                elif motor_id == 7:  # Gripper
-                    gripper_position = tic_pos
-                    
             # Set arm joint positions (6 joints)
             if len(arm_positions) == 6:
-                logger.debug(f"Setting arm positions: {arm_positions}")
+                logger.debug("Setting arm positions: %s", arm_positions)
                 self.arm.set_joint_positions(arm_positions)
                 
             # Set gripper position if present
             if gripper_position is not None:
                 gripper_cmd = self._convert_gripper_tics_to_cmd(gripper_position)
-                logger.debug(f"Gripper: tics={gripper_position} -> cmd={gripper_cmd:.3f}")
+                logger.debug("Gripper: tics=%s -> cmd=%.3f", gripper_position, gripper_cmd)
                 self.arm.set_catch_pos(gripper_cmd)
             
         except Exception as e:
             logger.error(f"Error writing joint positions: {e}")
             
-    def write_joint_tics_smoothed(self, positions: Dict[int, int], smoother):
+    def write_joint_tics_smoothed(self, positions: Union[Dict[int, int], List[int]], smoother):
         """Write joint positions with smoothing applied to arm joints."""
         if not self.connected or not self.arm:
             return
             
         try:
-            # Separate arm joints (1-6) from gripper (7)
-            arm_positions = np.zeros(6)  # 6 joints for ARX R5 arm
-            gripper_position = None
+            arm_positions, gripper_position = self._split_tics(positions)
             
-            for motor_id, tic_pos in positions.items():
-                if 1 <= motor_id <= 6:  # Arm joints
-                    # Get calibrated center for this motor
-                    servo_center = self.servo_centers.get(motor_id, 2048)
-                    
-                    # Check if this motor should be inverted
-                    if motor_id in self.invert_motors:
-                        # Inverted: flip motion around center point
-                        rad_pos = (servo_center - tic_pos) * self.servo_to_radian_scale
-                        logger.debug(f"Motor {motor_id} inverted: {tic_pos} -> {rad_pos:.3f}")
-                    else:
-                        # Normal: standard conversion
-                        rad_pos = (tic_pos - servo_center) * self.servo_to_radian_scale
-                        
-                    arm_positions[motor_id - 1] = rad_pos  # Convert to 0-indexed
-                    
-                elif motor_id == 7:  # Gripper
-                    gripper_position = tic_pos
-                    
             # Apply smoothing to arm joint positions (in radians)
             if len(arm_positions) == 6:
                 smoothed_positions = smoother.smooth(arm_positions)
@@ -356,7 +396,7 @@ class ARXArmWrapper:
             # Set gripper position if present
             if gripper_position is not None:
                 gripper_cmd = self._convert_gripper_tics_to_cmd(gripper_position)
-                logger.debug(f"Gripper: tics={gripper_position} -> cmd={gripper_cmd:.3f}")
+                logger.debug("Gripper: tics=%s -> cmd=%.3f", gripper_position, gripper_cmd)
                 self.arm.set_catch_pos(gripper_cmd)
             
         except Exception as e:
@@ -372,7 +412,7 @@ class ARXArmWrapper:
             float: Gripper command (-1.0 = fully closed, 0.0 = neutral, 1.0 = fully open)
         """
         # Get calibrated center position for gripper (motor 7)
-        servo_center = self.servo_centers.get(7, 2048)
+        servo_center = self._gripper_center
         
         # Define gripper range in tics (adjust this based on your gripper's actual range)
         # This assumes ±1000 tics from center gives full gripper range
@@ -392,7 +432,8 @@ class ARXArmWrapper:
 class FollowerHardware:
     """Main teleoperation class for single ARX follower."""
     
-    def __init__(self, can_port: str = "can0", robot_type: int = 1, calibration_file: str = "arx_leader_calibration.json"):
+    def __init__(self, can_port: str = "can0", robot_type: int = 1, calibration_file: str = "arx_leader_calibration.json",
+                 max_frame_age_ms: float = 0):
         self.can_port = can_port
         self.robot_type = robot_type
         self.calibration_file = calibration_file
@@ -400,10 +441,22 @@ class FollowerHardware:
         self.follower_right: Optional[ARXArmWrapper] = None
         self.running = False
         # Update tracking
-        self.last_update_time = 0
-        self.update_times = []
-        self.latencies = []
+        self.last_update_time = 0  # time.monotonic_ns() of the last applied frame
+        self.update_times = RollingWindow(100)  # Intervals between applied frames, in ns
+        # Freshness filtering
+        self.dropped_frames = 0
+        self.max_frame_age = max_frame_age_ms / 1000.0  # 0 disables the age check
+        # Set whenever a frame is applied; the display thread only redraws when set
+        self._display_dirty = threading.Event()
+        self._last_display_frame = ""
+        # Single-slot mailbox for the CAN writer thread: newest command wins
+        self._command_lock = threading.Lock()
+        self._pending_command = None
+        self._command_ready = threading.Event()
+        self._writer_thread: Optional[threading.Thread] = None
         self.s = zmq.Context().socket(zmq.PULL)
+        # Keep only the newest telemetry frame queued; older setpoints are stale (must precede bind)
+        self.s.setsockopt(zmq.CONFLATE, 1)
         self.s.bind("tcp://0.0.0.0:5000")
         print("Follower set up to ZMQ")
 
@@ -436,21 +489,18 @@ class FollowerHardware:
         logger.info(f"{Fore.GREEN}✓ Connected to 2 ARX follower arms {Style.RESET_ALL}")
      
     def apply_positions(self, telemetry_data: Dict):
-        """Apply received positions to ARX follower robot."""
-        timestamp = telemetry_data.get("timestamp", 0)
-        sequence = telemetry_data.get("sequence", 0)
-        left_positions_data = telemetry_data.get("left_positions", {})
-        right_positions_data = telemetry_data.get("right_positions", {})
+        """Hand received positions to the CAN writer thread.
+        
+        Only the newest command is kept; if the writer is still busy on the CAN
+        bus, an older unsent command is replaced rather than queued.
+        """
+        left_positions_data = telemetry_data.get("left_positions", [])  # Tics indexed by motor ID - 1
+        right_positions_data = telemetry_data.get("right_positions", [])
         dt_controls = telemetry_data.get("dt_controls", {})
         
         # Debug logging
-        logger.debug(f"Received positions: {left_positions_data} and {right_positions_data}")
+        logger.debug("Received positions: %s and %s", left_positions_data, right_positions_data)
         
-        # Calculate latency
-        latency = (time.time() - timestamp) * 1000  # ms
-        self.latencies.append(latency)
-        if len(self.latencies) > 100:
-            self.latencies.pop(0)
       
         # SIMPLIFIED: Direct position application for single arm
         if not self.follower_left or not self.follower_left.connected:
@@ -460,38 +510,51 @@ class FollowerHardware:
             logger.warning("Right follower not connected to apply positions")
             return
             
+        # Arm positions and drivetrain control values (in RPM)
+        command = (left_positions_data, right_positions_data,
+                   dt_controls.get("left_speed", 0), dt_controls.get("right_speed", 0), dt_controls.get("z_speed", 0))
+        with self._command_lock:
+            self._pending_command = command
+        self._command_ready.set()
+        
+    def write_command(self, left_positions_data: List[int], right_positions_data: List[int],
+                      left_motor_speed: float, right_motor_speed: float, z_motor_speed: float):
+        """Write one command to the drivetrain and both ARX arms over CAN."""
         try:
-            # Convert string motor IDs back to integers and create position dict
-            left_motor_positions = {}
-            right_motor_positions = {}
-            for motor_id_str, position in left_positions_data.items():
-                motor_id = int(motor_id_str)
-                left_motor_positions[motor_id] = position
-            for motor_id_str, position in right_positions_data.items():
-                motor_id = int(motor_id_str)
-                right_motor_positions[motor_id] = position
-                
-            logger.debug(f"Writing positions to ARX arm: {left_motor_positions} and {right_motor_positions}")
-            
-            # Get drivetrain control values (in RPM)
-            left_motor_speed = dt_controls.get("left_speed", 0)
-            right_motor_speed = dt_controls.get("right_speed", 0)
-            z_motor_speed = dt_controls.get("z_speed", 0)
-
             # Convert RPM to 0.1 RPM units (as per RS03 manual)
-            # and apply to motors
+            # and apply to motors, skipping SDO writes for unchanged setpoints
             #Drivetrain motor speed assignments
-            self.left_motor.sdo[TARGET_VELOCITY].raw = int(-left_motor_speed * 5)
-            self.right_motor.sdo[TARGET_VELOCITY].raw = int(right_motor_speed * 5)
-            self.z_motor.sdo[TARGET_VELOCITY].raw = int(z_motor_speed * 5)
+            dt_cmd = (int(-left_motor_speed * 5), int(right_motor_speed * 5), int(z_motor_speed * 5))
+            last_dt_cmd = self._last_dt_cmd
+            for i, (velocity, value) in enumerate(zip(self._dt_velocities, dt_cmd)):
+                if value != last_dt_cmd[i]:
+                    velocity.raw = value
+                    last_dt_cmd[i] = value
 
             # Apply positions to ARX arm with smoothing
-            self.follower_left.write_joint_tics(left_motor_positions)
-            self.follower_right.write_joint_tics(right_motor_positions)
+            self.follower_left.write_joint_tics(left_positions_data)
+            self.follower_right.write_joint_tics(right_positions_data)
             
         except Exception as e:
             logger.error(f"Error applying positions: {e}")
             
+    def command_writer_loop(self):
+        """Separate thread writing the newest received command to the CAN buses."""
+        if set_realtime_priority():
+            logger.info("CAN writer thread running with realtime priority")
+        else:
+            logger.info("CAN writer thread running with normal priority")
+            
+        while self.running and not shutdown_requested:
+            if not self._command_ready.wait(timeout=0.1):
+                continue
+            with self._command_lock:
+                command = self._pending_command
+                self._pending_command = None
+                self._command_ready.clear()
+            if command is not None:
+                self.write_command(*command)
+                
         
     def init_dt_motors(self):
         """Initialize drivetrain motors - all motors in velocity mode for follower."""
@@ -499,7 +562,7 @@ class FollowerHardware:
         # The follower receives velocity commands, not position commands
         dt_motors = [
             (self.left_motor, "Left"),
-            (self.right_motor, "Right")#,
+            (self.right_motor, "Right"),
             (self.z_motor, "Z")
         ]
         
@@ -530,13 +593,22 @@ class FollowerHardware:
             except Exception as e:
                 logger.error(f"Error initializing {name} motor: {e}")
                 
+        # Cache the velocity SDO variables written on every command
+        self._left_velocity = self.left_motor.sdo[TARGET_VELOCITY]
+        self._right_velocity = self.right_motor.sdo[TARGET_VELOCITY]
+        self._z_velocity = self.z_motor.sdo[TARGET_VELOCITY]
+        self._dt_velocities = (self._left_velocity, self._right_velocity, self._z_velocity)
+        # Last velocity written to each motor (None = unknown, always write)
+        self._last_dt_cmd = [None, None, None]
+                
     def stop_dt_motors(self):
         """Stop all drivetrain motors."""
         try:
             # Set velocity to 0 for all motors
-            self.left_motor.sdo[TARGET_VELOCITY].raw = 0
-            self.right_motor.sdo[TARGET_VELOCITY].raw = 0
-            self.z_motor.sdo[TARGET_VELOCITY].raw = 0
+            self._left_velocity.raw = 0
+            self._right_velocity.raw = 0
+            self._z_velocity.raw = 0
+            self._last_dt_cmd[:] = [0, 0, 0]
             
             # Disable all motors
             self.left_motor.sdo[CONTROLWORD].raw = 0
@@ -551,66 +623,98 @@ class FollowerHardware:
 
     def display_status(self):
         """Display current status and statistics."""
-        # Clear screen and move cursor to top
-        print("\033[2J\033[H", end="")
-        
-        print(f"{Style.BRIGHT}=== DUAL ARM ARX FOLLOWER TELEOPERATION ==={Style.RESET_ALL}")
-        
-        # Connected follower
-        print(f"{Style.BRIGHT}Connected Followers:{Style.RESET_ALL}")
+        lines = [
+            # Move cursor home and redraw over the previous frame instead of clearing the screen
+            f"\033[H{Style.BRIGHT}=== DUAL ARM ARX FOLLOWER TELEOPERATION ==={Style.RESET_ALL}",
+            # Connected follower
+            f"{Style.BRIGHT}Connected Followers:{Style.RESET_ALL}",
+        ]
         if self.follower_left and self.follower_right:
-            print(f"  ARX R5 - {'Connected' if self.follower_left.connected and self.follower_right.connected else 'Disconnected'}")
-            print(f"  Motors: 6 arm joints + 1 gripper")  # ARX R5 architecture
-        print()
+            lines.append(f"  ARX R5 - {'Connected' if self.follower_left.connected and self.follower_right.connected else 'Disconnected'}")
+            lines.append(f"  Motors: 6 arm joints + 1 gripper")  # ARX R5 architecture
+        lines.append("")
         
         # Update rate
         if self.update_times:
-            avg_interval = sum(self.update_times) / len(self.update_times)
+            avg_interval = self.update_times.mean() / 1e9
             actual_fps = 1.0 / avg_interval if avg_interval > 0 else 0
-            print(f"  Update Rate:     {actual_fps:.1f} Hz")
+            lines.append(f"  Update Rate:     {actual_fps:.1f} Hz")
+        lines.append(f"  Dropped Frames:  {self.dropped_frames}")
             
-        print()
-        print(f"{Fore.CYAN}Press Ctrl+C to stop{Style.RESET_ALL}")
+        lines.append("")
+        lines.append(f"{Fore.CYAN}Press Ctrl+C to stop{Style.RESET_ALL}")
+        
+        # Clear each line's tail and everything below, then emit the frame in one write
+        frame = "\033[K\n".join(lines) + "\033[K\n\033[J"
+        if frame == self._last_display_frame:
+            return  # Nothing visible changed
+        self._last_display_frame = frame
+        sys.stdout.write(frame)
+        sys.stdout.flush()
+        
+    def is_stale(self, telemetry_data: Dict) -> bool:
+        """Check whether a frame is older than the configured age limit.
+        
+        PUSH/PULL over one connection never reorders or duplicates, and CONFLATE
+        already keeps only the newest frame, so sequence numbers are not checked.
+        """
+        # Leader timestamps are wall-clock, so this is only meaningful with synced clocks
+        return bool(self.max_frame_age) and time.time() - telemetry_data.get("timestamp", 0) > self.max_frame_age
         
     def teleoperation_loop(self):
         """Main loop processing received positions."""
         self.running = True
         
-        # Start display thread
+        # Start CAN writer thread so slow bus writes never hold up receiving
+        self._writer_thread = threading.Thread(target=self.command_writer_loop, daemon=True)
+        self._writer_thread.start()
+        
+        # Start display thread (the only background thread besides the CAN writer)
         display_thread = threading.Thread(target=self.display_loop, daemon=True)
         display_thread.start()
         
-        # Start status thread
-        status_thread = threading.Thread(target=self.status_loop, daemon=True)
-        status_thread.start()
-        
         logger.info("Starting ARX follower teleoperation...")
         
+        # Bind the per-frame calls once for the receive loop
+        poll, recv, loads = self.s.poll, self.s.recv, json_loads
+        is_stale, apply_positions = self.is_stale, self.apply_positions
+        record_interval, mark_dirty = self.update_times.append, self._display_dirty.set
+        clock = time.monotonic_ns  # Immune to NTP clock steps
+        
+        # Move everything allocated during setup out of the collector's reach so
+        # cyclic GC passes during teleoperation only scan per-frame objects
+        gc.collect()
+        gc.freeze()
+        
         try:
             while self.running and not shutdown_requested:
-                # Check for new telemetry data (blocking receive)
+                # Block until telemetry arrives; the timeout keeps shutdown responsive
                 try:
-                    message = self.s.recv_string(flags=zmq.NOBLOCK)  # Non-blocking receive
+                    if not poll(100, POLLIN):
+                        continue
+                    message = recv(flags=NOBLOCK)  # Non-blocking receive; CONFLATE keeps it the newest
+                    telemetry_data = loads(message)
+                    if is_stale(telemetry_data):
+                        self.dropped_frames += 1
+                        mark_dirty()
+                        continue
+                        
                     # Process the latest data
-                    self.apply_positions(json.loads(message))
+                    apply_positions(telemetry_data)
                     
                     # Track update rate
-                    now = time.time()
+                    now = clock()
                     if self.last_update_time > 0:
-                        self.update_times.append(now - self.last_update_time)
-                        if len(self.update_times) > 100:
-                            self.update_times.pop(0)
+                        record_interval(now - self.last_update_time)
                     self.last_update_time = now
+                    mark_dirty()
                     
 
-                except zmq.Again:
+                except ZMQAgain:
                     # No message available, continue
                     pass
                 except Exception as e:
                     logger.error(f"Error receiving ZMQ message: {e}")
-                    
-                # Small sleep to prevent CPU spinning
-                time.sleep(0.001)
                 
         except KeyboardInterrupt:
             logger.info("\nStopping teleoperation...")
@@ -619,20 +723,23 @@ class FollowerHardware:
             
     def display_loop(self):
         """Separate thread for updating display."""
+        print("\033[2J", end="")  # Clear once; display_status redraws in place
+        self.display_status()
         while self.running and not shutdown_requested:
-            self.display_status()
-            time.sleep(0.5)  # Update display at 2Hz
-            
-    def status_loop(self):
-        """Send periodic status updates."""
-        while self.running and not shutdown_requested:
-            # TODO: Implement status updates via ZMQ if needed
-            time.sleep(2)  # Check every 2 seconds
+            # Redraw at most at 2Hz, and only once new telemetry has been applied
+            if self._display_dirty.wait(timeout=0.5):
+                self._display_dirty.clear()
+                self.display_status()
+                time.sleep(0.5)
             
     def shutdown(self):
         """Clean shutdown."""
         self.running = False
         
+        # Let the CAN writer finish its last command so it cannot overwrite the stop below
+        if self._writer_thread:
+            self._writer_thread.join(timeout=1.0)
+        
         # Stop drivetrain motors first
         logger.info("Stopping drivetrain motors...")
         self.stop_dt_motors()
@@ -676,6 +783,8 @@ def main():
                        help="Robot type (0 for X5lite, 1 for R5)")
     parser.add_argument("--calibration_file", type=str, default="arx_leader_calibration.json",
                        help="Path to calibration file for servo-to-ARX position mapping")
+    parser.add_argument("--max_frame_age_ms", type=float, default=0,
+                       help="Drop telemetry older than this (requires synced clocks, 0 = disabled)")
     parser.add_argument("--debug", action="store_true",
                        help="Enable debug logging")
     
@@ -687,7 +796,8 @@ def main():
         logger.debug("Debug logging enabled")
     
     # Create and run teleoperation
-    follower_hardware = FollowerHardware(args.can_port, args.robot_type, args.calibration_file)
+    follower_hardware = FollowerHardware(args.can_port, args.robot_type, args.calibration_file,
+                                         args.max_frame_age_ms)
     
     try:
         # Run main loop
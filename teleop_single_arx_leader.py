@@ -23,10 +23,51 @@ import signal
 import sys
 import time
 import threading
+from collections import deque
+from operator import itemgetter
 from typing import Dict, List, Optional
 from vassar_feetech_servo_sdk import ServoController
 import numpy as np
 
+# Telemetry encoder, chosen once at import: a typed msgspec Struct if msgspec is
+# installed, otherwise a reused dict through orjson or the stdlib (same JSON on the wire)
+try:
+    import msgspec
+    
+    class Telemetry(msgspec.Struct):
+        type: str
+        timestamp: float
+        sequence: int
+        left_positions: List[int]
+        right_positions: List[int]
+        dt_controls: Dict[str, float]
+        
+    _encode = msgspec.json.Encoder().encode
+    
+    def encode_telemetry(timestamp: float, sequence: int, left_positions: List[int],
+                         right_positions: List[int], dt_controls: Dict[str, float]) -> bytes:
+        return _encode(Telemetry("telemetry", timestamp, sequence, left_positions, right_positions, dt_controls))
+        
+except ImportError:
+    try:
+        import orjson
+        json_dumps = orjson.dumps
+    except ImportError:
+        def json_dumps(obj) -> bytes:
+            return json.dumps(obj).encode()
+            
+    # Reused message dict; only the per-frame fields change
+    _message = {"type": "telemetry"}
+    
+    def encode_telemetry(timestamp: float, sequence: int, left_positions: List[int],
+                         right_positions: List[int], dt_controls: Dict[str, float]) -> bytes:
+        _message["timestamp"] = timestamp
+        _message["sequence"] = sequence
+        _message["left_positions"] = left_positions
+        _message["right_positions"] = right_positions
+        _message["dt_controls"] = dt_controls
+        return json_dumps(_message)
+
 # Import select for Unix systems
 try:
     import select
@@ -45,65 +86,48 @@ except ImportError:
         RESET_ALL = BRIGHT = ""
 
 
+# Monotonic clock for internal rate bookkeeping (immune to NTP steps);
+# time.time() is only used for the on-wire timestamp
+_now_ns = time.monotonic_ns
+
 # Global flag for graceful shutdown
 shutdown_requested = False
+# Leader being run by main(), so the signal handler can wake its sleeping threads
+active_leader = None
 
 def signal_handler(signum, frame):
     """Handle SIGINT (Ctrl+C) for graceful shutdown."""
     global shutdown_requested
     print("\n\n⚠️  Shutdown requested. Cleaning up...")
     shutdown_requested = True
+    if active_leader is not None:
+        active_leader.request_stop()
 
 
 class NetworkMonitor:
-    """Monitor network statistics and latency."""
+    """Monitor sent and dropped telemetry counts.
+    
+    Latency and packet loss are not available: the follower sends nothing back
+    over the ZMQ link.
+    """
     
     def __init__(self):
         self.sent_count = 0
-        self.ack_count = 0
-        self.last_sent_time = {}
-        self.latencies = []
-        self.max_latency_samples = 100
+        self.dropped_count = 0
         
     def message_sent(self, sequence: int):
-        """Record when a message was sent."""
+        """Record that a message was sent."""
         self.sent_count += 1
-        self.last_sent_time[sequence] = time.time()
         
-    def message_acknowledged(self, sequence: int, timestamp: float):
-        """Calculate latency when acknowledgment received."""
-        if sequence in self.last_sent_time:
-            latency = (time.time() - self.last_sent_time[sequence]) * 1000  # ms
-            self.latencies.append(latency)
-            if len(self.latencies) > self.max_latency_samples:
-                self.latencies.pop(0)
-            self.ack_count += 1
-            del self.last_sent_time[sequence]
-            return latency
-        return None
+    def message_dropped(self):
+        """Record a message that could not be queued for sending."""
+        self.dropped_count += 1
         
     def get_stats(self) -> Dict:
         """Get current network statistics."""
-        if not self.latencies:
-            return {
-                "avg_latency": 0, 
-                "max_latency": 0, 
-                "packet_loss": 0,
-                "sent": self.sent_count,
-                "acked": self.ack_count
-            }
-            
-        avg_latency = sum(self.latencies) / len(self.latencies)
-        max_latency = max(self.latencies)
-        expected_acks = self.sent_count // 5  # Only every 5th packet expects ack
-        packet_loss = 1 - (self.ack_count / expected_acks) if expected_acks > 0 else 0
-        
         return {
-            "avg_latency": avg_latency,
-            "max_latency": max_latency,
-            "packet_loss": packet_loss,
             "sent": self.sent_count,
-            "acked": self.ack_count
+            "dropped": self.dropped_count
         }
 
 
@@ -113,20 +137,35 @@ class LeaderHardware: # TODO rename class to MarvinRobot
     def __init__(self, motor_ids: List[int], baudrate: int = 1000000, left_leader_port: str = "/dev/tty.usbmodem5A680090901", right_leader_port: str = "/dev/tty.usbmodem5A680135841"):
         self.left_leader_port = left_leader_port
         self.right_leader_port = right_leader_port
+        # The wire format indexes positions by motor ID - 1, so IDs must be 1..N in order
+        if list(motor_ids) != list(range(1, len(motor_ids) + 1)):
+            raise ValueError(f"motor_ids must be 1..N in order, got {motor_ids}")
         self.motor_ids = motor_ids
+        # Pulls positions out of a {motor_id: tics} dict in wire order; itemgetter
+        # returns a bare value for a single key, so that case gets a 1-tuple instead
+        if len(motor_ids) > 1:
+            self._positions_in_order = itemgetter(*motor_ids)
+        else:
+            self._positions_in_order = lambda positions: (positions[1],)
         self.baudrate = baudrate
         self.leader_left: Optional[ServoController] = None
         self.leader_right: Optional[ServoController] = None
         self.running = False
+        # Set on shutdown; the loops sleep on it so they exit immediately
+        self._stop_event = threading.Event()
         self.sequence = 0
         
         # Network components
         self.zmq_socket = None
+        # Set after each publish; the display thread only redraws when set
+        self._stats_dirty = threading.Event()
         self.monitor = NetworkMonitor()
         
         # Performance tracking
-        self.last_publish_time = 0
-        self.publish_times = []
+        self.last_publish_time = 0  # _now_ns() of the last publish
+        self.publish_times = deque(maxlen=100)  # Intervals between publishes, in ns
+        # Status line template, parsed once and filled by display_status
+        self._status_format = "LEADER {leader} | {rate} | Sent: {sent} | Dropped: {dropped}".format_map
         self.LIFT_SPEED_RPM = 50
         self.DRIVE_SPEED_RPM = 100
         self.TURN_SPEED_FACTOR = 0.7
@@ -253,33 +292,27 @@ class LeaderHardware: # TODO rename class to MarvinRobot
         """Publish position data via ZMQ."""
         self.sequence += 1
         
-        # SIMPLIFIED: No mapping needed for single arm - directly use positions
-        # Convert motor IDs to strings for JSON serialization
-        self.left_position_data = {str(motor_id): int(pos) for motor_id, pos in left_positions.items()}
-        self.right_position_data = {str(motor_id): int(pos) for motor_id, pos in right_positions.items()}
-        
-        message = {
-            "type": "telemetry",
-            "timestamp": time.time(),
-            "sequence": self.sequence,
-            "left_positions": self.left_position_data,  # Single arm positions
-            "right_positions": self.right_position_data,  # Single arm positions
-            "dt_controls": self.dt_controls
-        }
-        
         try:
+            # Positions go on the wire as lists indexed by motor ID - 1
+            self.left_position_data = list(map(int, self._positions_in_order(left_positions)))
+            self.right_position_data = list(map(int, self._positions_in_order(right_positions)))
+            
+            payload = encode_telemetry(time.time(), self.sequence, self.left_position_data,
+                                       self.right_position_data, self.dt_controls)
+            
             # Send via ZMQ
-            self.zmq_socket.send_string(json.dumps(message))
+            self.zmq_socket.send(payload, flags=zmq.NOBLOCK)
             self.monitor.message_sent(self.sequence)
             
             # Track publish rate
-            now = time.time()
+            now = _now_ns()
             if self.last_publish_time > 0:
                 self.publish_times.append(now - self.last_publish_time)
-                if len(self.publish_times) > 100:
-                    self.publish_times.pop(0)
             self.last_publish_time = now
+            self._stats_dirty.set()
             
+        except zmq.Again:
+            self.monitor.message_dropped()  # Follower not connected; frame discarded
         except Exception as e:
             print(f"Failed to publish: {e}")
             
@@ -290,26 +323,26 @@ class LeaderHardware: # TODO rename class to MarvinRobot
         # Build compact status line
         leader_status = "✓" if self.leader_left and self.leader_right else "❌"
         
-        # Network info
-        if stats['avg_latency'] > 0:
-            net_info = f"Latency: {stats['avg_latency']:.1f}ms | Loss: {stats['packet_loss']*100:.1f}%"
-        else:
-            net_info = "Network: Disconnected"
-        
         # Publish rate
         if self.publish_times:
-            avg_interval = sum(self.publish_times) / len(self.publish_times)
+            avg_interval = sum(self.publish_times) / len(self.publish_times) / 1e9
             actual_fps = 1.0 / avg_interval if avg_interval > 0 else 0
             rate_info = f"Rate: {actual_fps:.1f}Hz"
         else:
             rate_info = "Rate: --"
         
         # Single compact line
-        status_line = f"LEADER {leader_status} | {net_info} | {rate_info} | Sent: {stats['sent']}"
-        print(f"\r{status_line:<80}", end="", flush=True)
+        stats["leader"] = leader_status
+        stats["rate"] = rate_info
+        sys.stdout.write("\r" + self._status_format(stats).ljust(80))
+        sys.stdout.flush()
         
     def teleoperation_loop(self):
-        """Main loop reading positions and publishing."""
+        """Main loop: keyboard drivetrain control here, arm reading/publishing on its own thread.
+        
+        pygame must stay on the main thread, so the serial reads and ZMQ publishing
+        run in arm_loop; a slow servo read no longer stalls keyboard handling.
+        """
         self.running = True
         target_fps = 20  # Default 20 FPS
         target_interval = 1.0 / target_fps
@@ -318,13 +351,17 @@ class LeaderHardware: # TODO rename class to MarvinRobot
         display_thread = threading.Thread(target=self.display_loop, daemon=True)
         display_thread.start()
         
+        # Start arm thread (the only user of the ZMQ socket)
+        arm_thread = threading.Thread(target=self.arm_loop, args=(target_interval,), daemon=True)
+        arm_thread.start()
+        
         print(f"Starting single arm teleoperation at {target_fps} Hz...")
         print("Status updates every 2 seconds on single line. Press Ctrl+C to stop.")
         
         try:
             while self.running and not shutdown_requested:
                 
-                loop_start = time.time()
+                loop_start = _now_ns()
 
                 # TODO check if draw status works here
                 # Get all events
@@ -340,6 +377,27 @@ class LeaderHardware: # TODO rename class to MarvinRobot
 
                 self.handle_dt_input(events)
                 self.draw_status()
+                    
+                # Maintain target rate
+                elapsed = (_now_ns() - loop_start) / 1e9
+                if elapsed < target_interval:
+                    if self._stop_event.wait(target_interval - elapsed):
+                        break
+
+                    
+        except KeyboardInterrupt:
+            print()  # New line after status display
+            print("Stopping teleoperation...")
+        finally:
+            self.request_stop()
+            arm_thread.join(timeout=1.0)
+            
+    def arm_loop(self, target_interval: float):
+        """Separate thread reading the leader arms and publishing their positions."""
+        try:
+            while self.running and not shutdown_requested:
+                
+                loop_start = _now_ns()
                 
                 # Read positions from the leader
                 if self.leader_left and self.leader_right:
@@ -349,36 +407,43 @@ class LeaderHardware: # TODO rename class to MarvinRobot
                         self.publish_positions(left_positions, right_positions)
 
                     # left_torque = {id: 0 for id in range(1,8)}
-                    # left_torque[1] = 0.001*np.sign(self.left_position_data["1"] - 2048)
+                    # left_torque[1] = 0.001*np.sign(self.left_position_data[0] - 2048)
                     # right_torque = {id: 0 for id in range(1,8)}
-                    # right_torque[1] = 0.001*np.sign(self.right_position_data["1"] - 2048)
+                    # right_torque[1] = 0.001*np.sign(self.right_position_data[0] - 2048)
                     # print(f"Left torque: {left_torque[1]} \t Right torque: {right_torque[1]}")
                     # self.leader_left.write_torque(left_torque)
                     # self.leader_right.write_torque(right_torque)
                     
                 # Maintain target rate
-                elapsed = time.time() - loop_start
+                elapsed = (_now_ns() - loop_start) / 1e9
                 if elapsed < target_interval:
-                    time.sleep(target_interval - elapsed)
-
+                    if self._stop_event.wait(target_interval - elapsed):
+                        break
                     
-        except KeyboardInterrupt:
-            print()  # New line after status display
-            print("Stopping teleoperation...")
-        finally:
-            self.running = False
+        except Exception as e:
+            print(f"\nError reading leader arms: {e}")
+            self.request_stop()  # Stop the main loop too
 
 
             
     def display_loop(self):
         """Separate thread for updating display."""
+        # Redraw every 2 seconds, and only if something was published since the last one
         while self.running and not shutdown_requested:
-            self.display_status()
-            time.sleep(2.0)  # Update display at 0.5Hz (every 2 seconds) - much less frequent
+            if self._stop_event.wait(timeout=2.0):
+                break
+            if self._stats_dirty.is_set():
+                self._stats_dirty.clear()
+                self.display_status()
             
+    def request_stop(self):
+        """Ask the loops to exit, waking any of them that are sleeping."""
+        self.running = False
+        self._stop_event.set()
+        
     def shutdown(self):
         """Clean shutdown."""
-        self.running = False
+        self.request_stop()
         print()  # New line after status display
         
         # Disconnect robot
@@ -394,6 +459,8 @@ class LeaderHardware: # TODO rename class to MarvinRobot
 
 
 def main():
+    global active_leader
+    
     # Register signal handler for graceful shutdown
     signal.signal(signal.SIGINT, signal_handler)
     
@@ -413,11 +480,19 @@ def main():
     
     # Create and run teleoperation
     leader_hardware = LeaderHardware(motor_ids, args.baudrate)
+    active_leader = leader_hardware
     
     try:
         # Set up ZMQ streaming
         context = zmq.Context()
         leader_hardware.zmq_socket = context.socket(zmq.PUSH)
+        # Only the newest frame is worth sending: keep one queued message, queue only
+        # on a completed connection (so sends while the follower is down raise
+        # zmq.Again and are counted as dropped rather than delivered stale on
+        # reconnect), and never block the read loop (or shutdown) on an absent follower
+        leader_hardware.zmq_socket.setsockopt(zmq.CONFLATE, 1)
+        leader_hardware.zmq_socket.setsockopt(zmq.IMMEDIATE, 1)
+        leader_hardware.zmq_socket.setsockopt(zmq.LINGER, 0)
         leader_hardware.zmq_socket.connect("tcp://192.168.165.16:5000")
         # leader_hardware.zmq_socket.connect("tcp://marvin.local.tld:5000")
         # leader_hardware.zmq_socket.connect("tcp://10.1.10.85:5000")